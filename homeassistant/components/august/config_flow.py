@@ -1,7 +1,9 @@
 """Config flow for August integration."""
 from collections.abc import Mapping
 from dataclasses import dataclass
+import hashlib
 import logging
+from time import monotonic
 from typing import Any
 
 import aiohttp
@@ -18,6 +20,7 @@ from .const import (
     CONF_ACCESS_TOKEN_CACHE_FILE,
     CONF_BRAND,
     CONF_LOGIN_METHOD,
+    DATA_CONFIG_FLOW_SESSION,
     DEFAULT_LOGIN_METHOD,
     DOMAIN,
     LOGIN_METHODS,
@@ -29,6 +32,10 @@ from .util import async_create_august_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a successful "verification required" auth result may be
+# reused before we authenticate again.
+VALIDATION_CACHE_SECONDS = 60
+
 
 async def async_validate_input(
     data: dict[str, Any], august_gateway: AugustGateway
@@ -83,8 +90,10 @@ class AugustConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Store an AugustGateway()."""
         self._august_gateway: AugustGateway | None = None
-        self._aiohttp_session: aiohttp.ClientSession | None = None
         self._user_auth_details: dict[str, Any] = {}
+        self._validate_cache: (
+            tuple[tuple[str, str, str], float, ValidateResult] | None
+        ) = None
         self._needs_reset = True
         self._mode = None
         super().__init__()
@@ -154,20 +163,38 @@ class AugustConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    @callback
+    def _async_get_session(self) -> aiohttp.ClientSession:
+        """Get the shared config flow session.
+
+        The session is shared between config flow attempts so a retry or
+        reauth reuses the existing TCP connection pool instead of paying
+        for a new TLS handshake on every attempt.
+        """
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        session: aiohttp.ClientSession | None = domain_data.get(
+            DATA_CONFIG_FLOW_SESSION
+        )
+        if session is None or session.closed:
+            session = async_create_august_clientsession(self.hass)
+            domain_data[DATA_CONFIG_FLOW_SESSION] = session
+        return session
+
     @callback
     def _async_get_gateway(self) -> AugustGateway:
         """Set up the gateway."""
         if self._august_gateway is not None:
             return self._august_gateway
-        self._aiohttp_session = async_create_august_clientsession(self.hass)
-        self._august_gateway = AugustGateway(self.hass, self._aiohttp_session)
+        self._august_gateway = AugustGateway(self.hass, self._async_get_session())
         return self._august_gateway
 
     @callback
     def _async_shutdown_gateway(self) -> None:
-        """Shutdown the gateway."""
-        if self._aiohttp_session is not None:
-            self._aiohttp_session.detach()
+        """Shutdown the gateway.
+
+        The shared session is left open for subsequent flows; it is
+        cleaned up when Home Assistant stops.
+        """
         self._august_gateway = None
 
     async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
@@ -224,6 +251,25 @@ class AugustConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _async_auth_or_validate(self) -> ValidateResult:
         """Authenticate or validate."""
         user_auth_details = self._user_auth_details
+        credentials_key = (
+            user_auth_details.get(CONF_USERNAME, ""),
+            user_auth_details.get(CONF_BRAND, DEFAULT_BRAND),
+            hashlib.blake2b(
+                user_auth_details.get(CONF_PASSWORD, "").encode()
+            ).hexdigest(),
+        )
+        # If the same credentials were validated moments ago and we are
+        # still waiting for a verification code, re-submitting them does
+        # not need another authenticate round trip (which would also
+        # trigger a fresh verification code being sent).
+        if (
+            VERIFICATION_CODE_KEY not in user_auth_details
+            and (cached := self._validate_cache) is not None
+            and cached[0] == credentials_key
+            and monotonic() - cached[1] < VALIDATION_CACHE_SECONDS
+            and cached[2].validation_required
+        ):
+            return cached[2]
         gateway = self._async_get_gateway()
         assert gateway is not None
         await self._async_reset_access_token_cache_if_needed(
@@ -251,9 +297,12 @@ class AugustConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "unhandled"
             description_placeholders = {"error": str(ex)}
 
-        return ValidateResult(
+        validate_result = ValidateResult(
             validation_required, info, errors, description_placeholders
         )
+        if validation_required:
+            self._validate_cache = (credentials_key, monotonic(), validate_result)
+        return validate_result
 
     async def _async_update_or_create_entry(self, info: dict[str, Any]) -> FlowResult:
         """Update existing entry or create a new one."""
@@ -13,6 +13,8 @@ CONF_INSTALL_ID = "install_id"
 
 VERIFICATION_CODE_KEY = "verification_code"
 
+DATA_CONFIG_FLOW_SESSION = "config_flow_session"
+
 NOTIFICATION_ID = "august_notification"
 NOTIFICATION_TITLE = "August"
 
@@ -3,9 +3,17 @@
 import socket
 
 import aiohttp
+from aiohttp.hdrs import USER_AGENT
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.aiohttp_client import (
+    ENABLE_CLEANUP_CLOSED,
+    SERVER_SOFTWARE,
+    HassClientResponse,
+    _async_register_clientsession_shutdown,
+)
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
 
 
 @callback
@@ -21,4 +29,21 @@ def async_create_august_clientsession(hass: HomeAssistant) -> aiohttp.ClientSess
     # When https://github.com/aio-libs/aiohttp/issues/4451 is implemented
     # we can allow IPv6 again
     #
-    return aiohttp_client.async_create_clientsession(hass, family=socket.AF_INET)
+    # August only ever talks to a single API host, so enable DNS caching
+    # and long keep-alives: auth retries and the 2FA round trip then reuse
+    # the warm connection instead of resolving and handshaking again.
+    connector = aiohttp.TCPConnector(
+        family=socket.AF_INET,
+        enable_cleanup_closed=ENABLE_CLEANUP_CLOSED,
+        ssl=ssl_util.get_default_context(),
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        json_serialize=json_dumps,
+        response_class=HassClientResponse,
+        headers={USER_AGENT: SERVER_SOFTWARE},
+    )
+    _async_register_clientsession_shutdown(hass, session)
+    return session
@@ -0,0 +1,91 @@
+"""The BlueT integration."""
+from __future__ import annotations
+
+from time import monotonic
+
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth import BluetoothCallbackMatcher
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DATA_STALE_SWEEP,
+    DATA_STORAGE,
+    DOMAIN,
+    EDDYSTONE_SERVICE_UUID,
+    STALE_SWEEP_INTERVAL,
+)
+from .coordinator import BlueTCoordinator, create_device
+from .storage import async_get_storage
+
+PLATFORMS: list[Platform] = [Platform.SENSOR]
+
+
+@callback
+def _async_sweep_stale(domain_data: dict) -> None:
+    """Mark devices that have not been heard from as not present.
+
+    One shared periodic sweep covers every configured beacon, keeping
+    staleness bookkeeping off the per-packet path and out of each
+    coordinator's update cycle.
+    """
+    now_monotonic = monotonic()
+    for coordinator in domain_data.values():
+        if not isinstance(coordinator, BlueTCoordinator):
+            continue
+        if coordinator.device.maybe_mark_stale(now_monotonic):
+            coordinator.async_update_listeners()
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up BlueT from a config entry."""
+    storage = await async_get_storage(hass)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault(DATA_STORAGE, storage)
+
+    # Building the device fills its EID window with AES work; keep that
+    # off the event loop.
+    device = await hass.async_add_executor_job(create_device, entry, storage)
+    coordinator = domain_data[entry.entry_id] = BlueTCoordinator(
+        hass, entry, device, storage
+    )
+    # Only register the shared sweep once a coordinator exists: if setup
+    # fails before this point the entry never unloads, and a sweep
+    # registered earlier would keep firing for the life of the process.
+    if DATA_STALE_SWEEP not in domain_data:
+        domain_data[DATA_STALE_SWEEP] = async_track_time_interval(
+            hass,
+            lambda now: _async_sweep_stale(domain_data),
+            STALE_SWEEP_INTERVAL,
+        )
+    # The beacon is passive: there is nothing to poll at setup time, the
+    # first data arrives through the bluetooth callback. Mark the
+    # coordinator initialized instead of awaiting a first refresh, which
+    # would only delay the callback registration below.
+    coordinator.async_set_updated_data(None)
+
+    entry.async_on_unload(
+        bluetooth.async_register_callback(
+            hass,
+            coordinator.update_ble,
+            BluetoothCallbackMatcher(service_uuid=EDDYSTONE_SERVICE_UUID),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
+        if not any(
+            isinstance(value, BlueTCoordinator) for value in domain_data.values()
+        ):
+            domain_data.pop(DATA_STALE_SWEEP)()
+
+    return unload_ok
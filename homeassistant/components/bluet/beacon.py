@@ -0,0 +1,307 @@
+"""Eddystone-EID beacon tracking for the BlueT integration.
+
+A BlueT beacon broadcasts a rotating ephemeral identifier (EID) derived
+from a shared identity key and a monotonically increasing time counter,
+as described by the Eddystone-EID specification. Because the beacon's
+clock and ours drift, we maintain a window of EIDs around the beacon's
+last known counter value and match every received identifier against
+that window.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import struct
+from time import monotonic
+
+from Crypto.Cipher import AES
+from Crypto.Cipher._mode_ecb import EcbMode
+import numpy as np
+
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+from homeassistant.util import dt as dt_util
+
+from .const import EDDYSTONE_SERVICE_UUID, UNAVAILABLE_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+EDDYSTONE_EID_FRAME = 0x30
+EDDYSTONE_TLM_FRAME = 0x20
+ETLM_VERSION = 0x01
+
+EID_FRAME_LENGTH = 10
+ETLM_FRAME_LENGTH = 18
+
+# The beacon time counter is 32 bits and wraps.
+COUNTER_WRAP = 2**32
+
+# Precompiled pack/unpack formats for the per-packet hot path; a
+# struct.Struct skips re-parsing the format string on every call.
+# Temporary key plaintext: 11 zero bytes, 0xFF, 2 zero bytes, then the
+# upper 16 bits of the counter.
+_TKEY_STRUCT = struct.Struct(">11xB2xH")
+# EID plaintext: 11 zero bytes, the rotation exponent, then the
+# quantized 32-bit counter.
+_EID_STRUCT = struct.Struct(">11xBI")
+# Leading 32-bit counter of the 6-byte ETLM nonce.
+_NONCE_STRUCT = struct.Struct(">I")
+# Battery voltage and 8.8 fixed-point temperature of a TLM frame.
+_TLM_STRUCT = struct.Struct(">Hh")
+
+UNAVAILABLE_SECONDS = UNAVAILABLE_TIMEOUT.total_seconds()
+
+
+class BlueTDevice:
+    """Track a single Eddystone-EID beacon."""
+
+    def __init__(
+        self, identity_key: bytes, count: int, exponent: int, window_size: int
+    ) -> None:
+        """Initialize the device and precompute its EID window."""
+        self._identity_key = identity_key
+        self._identity_cipher = AES.new(identity_key, AES.MODE_ECB)
+        # The temporary key only changes when the upper 16 counter bits
+        # roll over (every 2^16 seconds); cache ready-to-use cipher
+        # objects for the recent ones so deriving an EID costs one ECB
+        # block instead of an AES key schedule plus an allocation.
+        self._tkey_ciphers: dict[int, EcbMode] = {}
+        self._exponent = exponent
+        self._window_size = window_size
+        # Rotation period and quantization mask derived from the
+        # exponent once, instead of re-evaluating 2**exponent in the
+        # window-shift loops.
+        self._step = 1 << exponent
+        self._mask = ~(self._step - 1) & 0xFFFFFFFF
+        # The count is always quantized to the rotation period.
+        self.count = count & self._mask
+        self.address: str | None = None
+        self.present = False
+        self.rssi: int | None = None
+        self.temperature: float | None = None
+        self.voltage: int | None = None
+        self.last_seen: datetime | None = None
+        # Monotonic companion of last_seen for cheap staleness math on
+        # the packet path; updated without allocating datetime objects.
+        self.last_seen_monotonic: float | None = None
+        # EID window stored structure-of-arrays style: one contiguous
+        # (2 * window + 1, 8) byte matrix plus a parallel vector of the
+        # counter value each row was derived from. Keeping the EIDs in a
+        # single contiguous buffer lets the per-packet match run as one
+        # vectorized compare instead of a Python-level scan.
+        # The window is a ring buffer: logical slot i lives at physical
+        # slot (head + i) % N, so sliding the window is an O(1) head
+        # advance plus deriving only the vacated slots.
+        num_slots = self._num_slots = 2 * window_size + 1
+        self._eid_bytes = np.empty((num_slots, 8), dtype=np.uint8)
+        self._eid_counts = np.empty(num_slots, dtype=np.uint32)
+        self._head = 0
+        # Maps each EID currently in the window to its physical slot so
+        # a received identifier resolves in one hash lookup.
+        self._eid_index: dict[bytes, int] = {}
+        # Reusable scratch buffers: the 6-byte ETLM nonce and the
+        # 16-byte EID plaintext block (first 11 bytes stay zero).
+        self._nonce_buf = bytearray(6)
+        self._eid_buf = bytearray(16)
+        # Refcounted two-byte prefixes of the window EIDs; adverts from
+        # unrelated beacons are rejected on the prefix alone, before the
+        # full identifier is hashed. A refcount (rather than a set) keeps
+        # the filter correct if two window entries share a prefix.
+        self._eid_prefixes: dict[int, int] = {}
+        self._compute_eids()
+
+    def _temporary_key_cipher(self, upper_count: int) -> EcbMode:
+        """Return a cipher keyed for the upper 16 counter bits."""
+        if (cipher := self._tkey_ciphers.get(upper_count)) is None:
+            temp_key_data = _TKEY_STRUCT.pack(0xFF, upper_count)
+            temp_key = self._identity_cipher.encrypt(temp_key_data)
+            cipher = AES.new(temp_key, AES.MODE_ECB)
+            if len(self._tkey_ciphers) >= 4:
+                self._tkey_ciphers.pop(next(iter(self._tkey_ciphers)))
+            self._tkey_ciphers[upper_count] = cipher
+        return cipher
+
+    def _compute_eid(self, count: int) -> bytes:
+        """Compute the EID broadcast at a quantized counter value."""
+        cipher = self._temporary_key_cipher(count >> 16)
+        _EID_STRUCT.pack_into(self._eid_buf, 0, self._exponent, count)
+        return cipher.encrypt(self._eid_buf)[:8]
+
+    def _compute_eids(self) -> None:
+        """Fill the EID window centered on the current count.
+
+        Counts sharing the same upper 16 bits also share a temporary key,
+        so their EID blocks are concatenated and encrypted with a single
+        AES-ECB call per key instead of one cipher object per slot.
+        """
+        period = self._step
+        base = self.count - self._window_size * period
+        num_slots = self._num_slots
+        counts = [(base + slot * period) % COUNTER_WRAP for slot in range(num_slots)]
+        self._head = 0
+        self._eid_counts[:] = counts
+        self._eid_index.clear()
+        self._eid_prefixes.clear()
+        slot = 0
+        while slot < num_slots:
+            upper_count = counts[slot] >> 16
+            run_end = slot + 1
+            while run_end < num_slots and counts[run_end] >> 16 == upper_count:
+                run_end += 1
+            cipher = self._temporary_key_cipher(upper_count)
+            plaintext = b"".join(
+                _EID_STRUCT.pack(self._exponent, count)
+                for count in counts[slot:run_end]
+            )
+            ciphertext = cipher.encrypt(plaintext)
+            for offset in range(run_end - slot):
+                eid = ciphertext[offset * 16 : offset * 16 + 8]
+                self._eid_bytes[slot + offset] = np.frombuffer(eid, dtype=np.uint8)
+                self._eid_index[eid] = slot + offset
+                self._add_prefix(eid)
+            slot = run_end
+
+    def process_packet(self, service_info: BluetoothServiceInfoBleak) -> bool:
+        """Process an Eddystone advertisement that may be from this beacon.
+
+        Returns True if the advertisement belonged to this beacon and
+        updated its state.
+        """
+        data = service_info.service_data.get(EDDYSTONE_SERVICE_UUID)
+        if not data:
+            return False
+        frame_type = data[0]
+        # data.hex() is not free and this callback fires for every
+        # Eddystone advertisement in range, so only format the debug
+        # message when debug logging is actually enabled.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if frame_type == EDDYSTONE_EID_FRAME and len(data) >= EID_FRAME_LENGTH:
+            if debug:
+                _LOGGER.debug(
+                    "Received EID frame %s from %s", data.hex(), service_info.address
+                )
+            if self._process_eid(data[2:10], service_info.address):
+                self.rssi = service_info.rssi
+                return True
+        elif frame_type == EDDYSTONE_TLM_FRAME and len(data) >= ETLM_FRAME_LENGTH:
+            if service_info.address == self.address:
+                if debug:
+                    _LOGGER.debug(
+                        "Received ETLM frame %s from %s",
+                        data.hex(),
+                        service_info.address,
+                    )
+                return self._process_etlm(data)
+        return False
+
+    def _process_eid(self, received_eid: bytes, address: str) -> bool:
+        """Match a received EID against the window.
+
+        Returns True if the EID belongs to this beacon.
+        """
+        if int.from_bytes(received_eid[:2], "big") not in self._eid_prefixes:
+            return False
+        if (index := self._eid_index.get(received_eid)) is None:
+            return False
+        self._handle_eid_match(index, address)
+        return True
+
+    def _add_prefix(self, eid: bytes) -> None:
+        """Add an EID's two-byte prefix to the prefilter."""
+        prefix = int.from_bytes(eid[:2], "big")
+        self._eid_prefixes[prefix] = self._eid_prefixes.get(prefix, 0) + 1
+
+    def _remove_prefix(self, eid: bytes) -> None:
+        """Drop an evicted EID's two-byte prefix from the prefilter."""
+        prefix = int.from_bytes(eid[:2], "big")
+        if (refs := self._eid_prefixes.get(prefix, 0)) <= 1:
+            self._eid_prefixes.pop(prefix, None)
+        else:
+            self._eid_prefixes[prefix] = refs - 1
+
+    def _replace_slot(self, slot: int, count: int) -> None:
+        """Re-derive one window slot for a new counter value."""
+        old_eid = self._eid_bytes[slot].tobytes()
+        self._eid_index.pop(old_eid, None)
+        self._remove_prefix(old_eid)
+        eid = self._compute_eid(count)
+        self._eid_counts[slot] = count
+        self._eid_bytes[slot] = np.frombuffer(eid, dtype=np.uint8)
+        self._eid_index[eid] = slot
+        self._add_prefix(eid)
+
+    def _handle_eid_match(self, index: int, address: str) -> None:
+        """Advance the window so the matched EID becomes its center.
+
+        index is the physical slot of the match in the ring buffer.
+        """
+        head = self._head
+        num_slots = self._num_slots
+        shift = (index - head) % num_slots - self._window_size
+        period = self._step
+        if shift > 0:
+            # The beacon's clock is ahead of the window center; the slots
+            # falling off the head become the new tail of the window.
+            max_count = int(self._eid_counts[(head - 1) % num_slots])
+            for offset in range(shift):
+                slot = (head + offset) % num_slots
+                count = (max_count + (offset + 1) * period) % COUNTER_WRAP
+                self._replace_slot(slot, count)
+            self._head = (head + shift) % num_slots
+        elif shift < 0:
+            # The beacon's clock is behind the window center; the slots
+            # falling off the tail become the new head of the window.
+            min_count = int(self._eid_counts[head])
+            for offset in range(1, -shift + 1):
+                slot = (head - offset) % num_slots
+                count = (min_count - offset * period) % COUNTER_WRAP
+                self._replace_slot(slot, count)
+            self._head = (head + shift) % num_slots
+        # Plain int, not a numpy scalar: count feeds Python arithmetic
+        # and struct packing on every packet.
+        self.count = int(self._eid_counts[(self._head + self._window_size) % num_slots])
+        self.address = address
+        self.present = True
+        self.last_seen = dt_util.utcnow()
+        self.last_seen_monotonic = monotonic()
+
+    def maybe_mark_stale(self, now_monotonic: float) -> bool:
+        """Mark the device not present if nothing was heard recently.
+
+        Returns True if the device just went stale.
+        """
+        if (
+            self.present
+            and self.last_seen_monotonic is not None
+            and now_monotonic - self.last_seen_monotonic > UNAVAILABLE_SECONDS
+        ):
+            self.present = False
+            self.rssi = None
+            return True
+        return False
+
+    def _process_etlm(self, data: bytes) -> bool:
+        """Decrypt and apply an encrypted TLM (telemetry) frame.
+
+        Returns True if the frame verified and the telemetry was applied.
+        """
+        if data[1] != ETLM_VERSION:
+            return False
+        etlm = data[2:14]
+        mic = data[16:18]
+        _NONCE_STRUCT.pack_into(self._nonce_buf, 0, self.count)
+        self._nonce_buf[4:6] = data[14:16]
+        cipher = AES.new(
+            self._identity_key, AES.MODE_EAX, nonce=bytes(self._nonce_buf), mac_len=2
+        )
+        try:
+            tlm = cipher.decrypt_and_verify(etlm, mic)
+        except ValueError:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("ETLM frame %s failed integrity check", data.hex())
+            return False
+        voltage, temperature = _TLM_STRUCT.unpack_from(tlm)
+        self.voltage = voltage
+        # Temperature is 8.8 signed fixed point, in degrees Celsius.
+        self.temperature = temperature / 256
+        self.last_seen_monotonic = monotonic()
+        return True
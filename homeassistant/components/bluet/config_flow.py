@@ -0,0 +1,82 @@
+"""Config flow for the BlueT integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigFlow
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    TextSelector,
+)
+
+from .const import (
+    CONF_COUNT,
+    CONF_EXPONENT,
+    CONF_IDENTITY_KEY,
+    DEFAULT_EXPONENT,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_IDENTITY_KEY): TextSelector(),
+        vol.Required(CONF_COUNT, default=0): NumberSelector(
+            NumberSelectorConfig(min=0, max=2**32 - 1, mode=NumberSelectorMode.BOX)
+        ),
+        vol.Required(CONF_EXPONENT, default=DEFAULT_EXPONENT): NumberSelector(
+            NumberSelectorConfig(min=0, max=15, mode=NumberSelectorMode.BOX)
+        ),
+    }
+)
+
+
+def normalize_identity_key(key: str) -> str | None:
+    """Normalize an identity key, or return None if it is invalid."""
+    key = key.replace(" ", "").lower()
+    if len(key) != 32:
+        return None
+    try:
+        bytes.fromhex(key)
+    except ValueError:
+        return None
+    return key
+
+
+class BlueTConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for BlueT."""
+
+    VERSION = 1
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the initial step."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if (key := normalize_identity_key(user_input[CONF_IDENTITY_KEY])) is None:
+                errors[CONF_IDENTITY_KEY] = "invalid_key_format"
+            else:
+                await self.async_set_unique_id(key)
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=f"BlueT {key[:8]}",
+                    data={
+                        CONF_IDENTITY_KEY: key,
+                        CONF_COUNT: int(user_input[CONF_COUNT]),
+                        CONF_EXPONENT: int(user_input[CONF_EXPONENT]),
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=STEP_USER_DATA_SCHEMA,
+            errors=errors,
+        )
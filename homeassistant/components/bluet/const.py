@@ -0,0 +1,23 @@
+"""Constants for the BlueT integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Final
+
+DOMAIN: Final = "bluet"
+
+DATA_STORAGE: Final = "storage"
+DATA_STALE_SWEEP: Final = "stale_sweep"
+
+CONF_IDENTITY_KEY: Final = "identity_key"
+CONF_COUNT: Final = "count"
+CONF_EXPONENT: Final = "exponent"
+
+DEFAULT_EXPONENT: Final = 12
+DEFAULT_WINDOW_SIZE: Final = 12
+
+EDDYSTONE_SERVICE_UUID: Final = "0000feaa-0000-1000-8000-00805f9b34fb"
+
+UPDATE_INTERVAL: Final = timedelta(seconds=60)
+UNAVAILABLE_TIMEOUT: Final = timedelta(minutes=5)
+STALE_SWEEP_INTERVAL: Final = timedelta(seconds=30)
@@ -0,0 +1,124 @@
+"""Coordinator for the BlueT integration."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.components.bluetooth import (
+    BluetoothChange,
+    BluetoothServiceInfoBleak,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .beacon import BlueTDevice
+from .const import (
+    CONF_COUNT,
+    CONF_EXPONENT,
+    CONF_IDENTITY_KEY,
+    DEFAULT_WINDOW_SIZE,
+    UPDATE_INTERVAL,
+)
+from .storage import BlueTStorage
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def create_device(entry: ConfigEntry, storage: BlueTStorage) -> BlueTDevice:
+    """Build the tracked device for a config entry.
+
+    Filling the initial EID window costs a couple of AES key schedules
+    plus one block per window slot, so callers run this in an executor
+    rather than on the event loop.
+    """
+    count = entry.data[CONF_COUNT]
+    # Prefer the persisted counter over the configured one: the
+    # beacon's clock keeps running while Home Assistant is down.
+    if (item := storage.async_get_item(entry.data[CONF_IDENTITY_KEY])) is not None:
+        count = max(count, item["count"])
+    return BlueTDevice(
+        identity_key=storage.get_identity_bytes(entry.data[CONF_IDENTITY_KEY]),
+        count=count,
+        exponent=entry.data[CONF_EXPONENT],
+        window_size=DEFAULT_WINDOW_SIZE,
+    )
+
+
+class BlueTCoordinator(DataUpdateCoordinator[None]):
+    """Coordinator that tracks a single BlueT beacon."""
+
+    # The base class keeps a __dict__ for its own attributes; slotting
+    # the per-beacon state still gives offset-based access to the names
+    # the packet and persist paths touch.
+    __slots__ = (
+        "entry",
+        "device",
+        "_process_packet",
+        "_storage",
+        "_identity_key",
+        "_last_saved_seen",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        device: BlueTDevice,
+        storage: BlueTStorage,
+    ) -> None:
+        """Initialize the coordinator around its tracked device."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"BlueT {entry.title}",
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.entry = entry
+        self.device = device
+        # Pre-bound for the per-advertisement callback, avoiding the
+        # device attribute and method lookups on every packet.
+        self._process_packet = device.process_packet
+        self._storage = storage
+        # Entry data is immutable for the coordinator's lifetime.
+        self._identity_key: str = entry.data[CONF_IDENTITY_KEY]
+        # last_seen value at the time of the previous persist, used to
+        # skip ticks where the beacon was not heard from.
+        self._last_saved_seen: datetime | None = None
+
+    @callback
+    def update_ble(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Handle an incoming Eddystone advertisement."""
+        # The matcher filters on the Eddystone service UUID only, so
+        # frames from foreign beacons land here too; only notify the
+        # sensors when the packet actually updated this beacon.
+        if self._process_packet(service_info):
+            self.async_update_listeners()
+
+    async def _async_update_data(self) -> None:
+        """Persist the beacon state."""
+        device = self.device
+        # Identity check: the device builds a new datetime per packet,
+        # so an unchanged reference means nothing was heard, without
+        # paying for a field-by-field datetime comparison.
+        if device.last_seen is None or device.last_seen is self._last_saved_seen:
+            return
+        self._last_saved_seen = device.last_seen
+        # Mutate the record the storage already owns instead of building
+        # a fresh dict on every tick; only the first persist allocates.
+        if (item := self._storage.async_get_item(self._identity_key)) is None:
+            self._storage.async_update_item(
+                self._identity_key,
+                {
+                    "identity_key": self._identity_key,
+                    # The device keeps its count as a plain int.
+                    "count": device.count,
+                    "last_seen": device.last_seen.isoformat(),
+                },
+            )
+            return
+        item["count"] = device.count
+        item["last_seen"] = device.last_seen.isoformat()
+        self._storage.async_schedule_save()
@@ -0,0 +1,119 @@
+"""Support for BlueT sensors."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfElectricPotential,
+    UnitOfTemperature,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .beacon import BlueTDevice
+from .const import DOMAIN
+from .coordinator import BlueTCoordinator
+
+
+@dataclass
+class BlueTSensorEntityDescriptionMixin:
+    """Mixin for required BlueT sensor description keys."""
+
+    value_fn: Callable[[BlueTDevice], StateType]
+
+
+@dataclass
+class BlueTSensorEntityDescription(
+    SensorEntityDescription, BlueTSensorEntityDescriptionMixin
+):
+    """Describes a BlueT sensor entity."""
+
+
+DEVICE_ENTITY_DESCRIPTIONS: tuple[BlueTSensorEntityDescription, ...] = (
+    BlueTSensorEntityDescription(
+        key="temperature",
+        translation_key="temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=attrgetter("temperature"),
+    ),
+    BlueTSensorEntityDescription(
+        key="voltage",
+        translation_key="voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=attrgetter("voltage"),
+    ),
+    BlueTSensorEntityDescription(
+        key="rssi",
+        translation_key="signal_strength",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=attrgetter("rssi"),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up BlueT sensors from a config entry."""
+    coordinator: BlueTCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # The config flow always sets the identity key as the unique id.
+    assert entry.unique_id is not None
+    # One DeviceInfo shared by all of the beacon's sensors; HA treats
+    # it as immutable.
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.unique_id)},
+        name=entry.title,
+        manufacturer="BlueT",
+    )
+    async_add_entities(
+        BlueTSensorEntity(coordinator, description, device_info)
+        for description in DEVICE_ENTITY_DESCRIPTIONS
+    )
+
+
+class BlueTSensorEntity(CoordinatorEntity[BlueTCoordinator], SensorEntity):
+    """A sensor exposing one telemetry value of a BlueT beacon."""
+
+    entity_description: BlueTSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BlueTCoordinator,
+        description: BlueTSensorEntityDescription,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.entry.unique_id}_{description.key}"
+        self._attr_device_info = device_info
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.device)
@@ -0,0 +1,100 @@
+"""Storage for the BlueT integration.
+
+The beacon time counter must survive restarts: if we lose it we can no
+longer predict which EIDs the beacon is broadcasting. Persist the last
+known counter value for every configured beacon.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+# Counter updates from many beacons arrive close together; coalesce
+# them into one delayed disk write instead of saving per update.
+SAVE_DELAY = 10
+
+# Only data read back from disk is validated; the update path writes
+# dicts this integration built itself, and running them through
+# voluptuous once per coordinator tick per beacon was pure overhead.
+BEACON_SCHEMA = vol.Schema(
+    {
+        vol.Required("identity_key"): cv.string,
+        vol.Required("count"): cv.positive_int,
+        vol.Required("last_seen"): cv.string,
+    }
+)
+
+STORAGE_SCHEMA = vol.Schema({cv.string: BEACON_SCHEMA})
+
+
+class BlueTStorage:
+    """Persist beacon counters between restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage."""
+        self.hass = hass
+        self.data: dict[str, dict[str, Any]] = {}
+        self._identity_bytes: dict[str, bytes] = {}
+        # No custom encoder: Store serializes with orjson unless one is
+        # passed, and everything stored here is plain JSON types.
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+
+    async def async_load(self) -> None:
+        """Load the stored beacon state from disk."""
+        if (data := await self._store.async_load()) is not None:
+            self.data = STORAGE_SCHEMA(data)
+
+    def get_identity_bytes(self, identity_key: str) -> bytes:
+        """Return the decoded bytes form of a hex identity key.
+
+        The decode is memoized so entry reloads reuse the earlier result.
+        """
+        if (identity_bytes := self._identity_bytes.get(identity_key)) is None:
+            identity_bytes = self._identity_bytes[identity_key] = bytes.fromhex(
+                identity_key
+            )
+        return identity_bytes
+
+    def async_get_item(self, key: str) -> dict[str, Any] | None:
+        """Return the stored state for a beacon, if any."""
+        return self.data.get(key)
+
+    @callback
+    def async_update_item(self, key: str, item: dict[str, Any]) -> None:
+        """Store the state for a beacon and schedule a delayed save."""
+        self.data[key] = item
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save after a record was mutated in place."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to persist."""
+        return self.data
+
+
+@singleton(f"{DOMAIN}_storage")
+async def async_get_storage(hass: HomeAssistant) -> BlueTStorage:
+    """Return the shared beacon storage, loading it on first use.
+
+    All config entries share one store; the singleton helper makes sure
+    concurrent entry setups during startup trigger a single disk read.
+    """
+    storage = BlueTStorage(hass)
+    await storage.async_load()
+    return storage
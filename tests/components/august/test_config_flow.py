@@ -219,6 +219,69 @@ async def test_form_needs_validate(hass: HomeAssistant) -> None:
     assert len(mock_setup_entry.mock_calls) == 1
 
 
+async def test_revalidate_uses_cached_result(hass: HomeAssistant) -> None:
+    """Test re-submitting the same credentials while 2fa is pending is cached."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    user_input = {
+        CONF_LOGIN_METHOD: "email",
+        CONF_USERNAME: "my@email.tld",
+        CONF_PASSWORD: "test-password",
+    }
+    with patch(
+        "homeassistant.components.august.config_flow.AugustGateway.async_authenticate",
+        side_effect=RequireValidation,
+    ) as mock_authenticate, patch(
+        "homeassistant.components.august.gateway.AuthenticatorAsync.async_send_verification_code",
+        return_value=True,
+    ) as mock_send_verification_code:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+
+    assert len(mock_authenticate.mock_calls) == 1
+    assert len(mock_send_verification_code.mock_calls) == 1
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "validation"
+
+    # Submitting the same credentials again while the verification code
+    # is still pending must reuse the cached result instead of
+    # re-authenticating, which would push a fresh code to the user.
+    flow = hass.config_entries.flow._progress[result["flow_id"]]
+    with patch(
+        "homeassistant.components.august.config_flow.AugustGateway.async_authenticate",
+        side_effect=RequireValidation,
+    ) as mock_authenticate, patch(
+        "homeassistant.components.august.gateway.AuthenticatorAsync.async_send_verification_code",
+        return_value=True,
+    ) as mock_send_verification_code:
+        result3 = await flow.async_step_user_validate(user_input)
+
+    assert len(mock_authenticate.mock_calls) == 0
+    assert len(mock_send_verification_code.mock_calls) == 0
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["step_id"] == "validation"
+
+    # A different password is a new attempt and must bypass the cache.
+    with patch(
+        "homeassistant.components.august.config_flow.AugustGateway.async_authenticate",
+        side_effect=RequireValidation,
+    ) as mock_authenticate, patch(
+        "homeassistant.components.august.gateway.AuthenticatorAsync.async_send_verification_code",
+        return_value=True,
+    ) as mock_send_verification_code:
+        result4 = await flow.async_step_user_validate(
+            user_input | {CONF_PASSWORD: "new-test-password"}
+        )
+
+    assert len(mock_authenticate.mock_calls) == 1
+    assert len(mock_send_verification_code.mock_calls) == 1
+    assert result4["type"] is FlowResultType.FORM
+    assert result4["step_id"] == "validation"
+
+
 async def test_form_reauth(hass: HomeAssistant) -> None:
     """Test reauthenticate."""
 
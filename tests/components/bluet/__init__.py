@@ -0,0 +1,117 @@
+"""Tests for the BlueT integration."""
+from __future__ import annotations
+
+from functools import lru_cache
+import struct
+from types import MappingProxyType
+from unittest.mock import patch
+
+from Crypto.Cipher import AES
+
+from homeassistant.components import bluet
+from homeassistant.components.bluet.const import (
+    CONF_COUNT,
+    CONF_EXPONENT,
+    CONF_IDENTITY_KEY,
+    EDDYSTONE_SERVICE_UUID,
+)
+from homeassistant.helpers.service_info.bluetooth import BluetoothServiceInfo
+
+FAKE_IDENTITY_KEY_1 = "00112233445566778899aabbccddeeff"
+FAKE_IDENTITY_KEY_2 = "ffeeddccbbaa99887766554433221100"
+
+FAKE_IDENTITY_KEY_1_BYTES = bytes.fromhex(FAKE_IDENTITY_KEY_1)
+FAKE_IDENTITY_KEY_2_BYTES = bytes.fromhex(FAKE_IDENTITY_KEY_2)
+
+FAKE_ADDRESS_1 = "44:44:33:11:23:45"
+
+FAKE_COUNT_1 = 0x00012000
+FAKE_EXPONENT_1 = 12
+
+# Read-only views: the same mapping is shared across every test that
+# configures a beacon, so accidental mutation in one test must not
+# leak into the next.
+FAKE_CONFIG_DATA_1 = MappingProxyType(
+    {
+        CONF_IDENTITY_KEY: FAKE_IDENTITY_KEY_1,
+        CONF_COUNT: FAKE_COUNT_1,
+        CONF_EXPONENT: FAKE_EXPONENT_1,
+    }
+)
+
+FAKE_CONFIG_DATA_2 = MappingProxyType(
+    {
+        CONF_IDENTITY_KEY: FAKE_IDENTITY_KEY_2,
+        CONF_COUNT: FAKE_COUNT_1,
+        CONF_EXPONENT: FAKE_EXPONENT_1,
+    }
+)
+
+
+@lru_cache
+def _identity_cipher(identity_key: bytes):
+    """Return a cached ECB cipher for an identity key.
+
+    ECB is stateless, so one cipher per key serves every EID packet a
+    test generates. The per-nonce EAX ciphers cannot be shared this way.
+    """
+    return AES.new(identity_key, AES.MODE_ECB)
+
+
+def _generate_eid_packet(identity_key: bytes, count: int, exponent: int) -> bytes:
+    """Generate an Eddystone-EID frame as the beacon would broadcast it."""
+    quantized = count & ~(2**exponent - 1)
+    temp_key = _identity_cipher(identity_key).encrypt(
+        b"\x00" * 11 + b"\xff\x00\x00" + struct.pack(">H", quantized >> 16)
+    )
+    eid = AES.new(temp_key, AES.MODE_ECB).encrypt(
+        b"\x00" * 11 + struct.pack(">BI", exponent, quantized)
+    )[:8]
+    return bytes([0x30, 0x00]) + eid
+
+
+def _generate_etlm_packet(
+    identity_key: bytes,
+    count: int,
+    voltage: int,
+    temperature: float,
+    salt: bytes = b"\x12\x34",
+) -> bytes:
+    """Generate an encrypted TLM frame as the beacon would broadcast it."""
+    nonce = struct.pack(">I", count) + salt
+    cipher = AES.new(identity_key, AES.MODE_EAX, nonce=nonce, mac_len=2)
+    tlm = struct.pack(">HhII", voltage, int(temperature * 256), 0, count)
+    etlm, mic = cipher.encrypt_and_digest(tlm)
+    return bytes([0x20, 0x01]) + etlm + salt + mic
+
+
+def patch_async_setup_entry():
+    """Patch the integration setup so flow tests skip a full entry setup.
+
+    patch.object on the already-imported module avoids re-resolving the
+    dotted path on every test.
+    """
+    return patch.object(bluet, "async_setup_entry", return_value=True)
+
+
+def build_eddystone_service_info(
+    packet: bytes, address: str = FAKE_ADDRESS_1
+) -> BluetoothServiceInfo:
+    """Wrap an Eddystone frame in a BluetoothServiceInfo."""
+    return BluetoothServiceInfo(
+        name="",
+        address=address,
+        rssi=-60,
+        manufacturer_data={},
+        service_data={EDDYSTONE_SERVICE_UUID: packet},
+        service_uuids=[EDDYSTONE_SERVICE_UUID],
+        source="local",
+    )
+
+
+EID_PACKET_1 = _generate_eid_packet(
+    FAKE_IDENTITY_KEY_1_BYTES, FAKE_COUNT_1, FAKE_EXPONENT_1
+)
+ETLM_PACKET_1 = _generate_etlm_packet(
+    FAKE_IDENTITY_KEY_1_BYTES, FAKE_COUNT_1, voltage=3000, temperature=25.5
+)
@@ -0,0 +1,95 @@
+"""Test the BlueT config flow."""
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.components.bluet.const import (
+    CONF_COUNT,
+    CONF_EXPONENT,
+    CONF_IDENTITY_KEY,
+    DOMAIN,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from . import (
+    FAKE_CONFIG_DATA_1,
+    FAKE_COUNT_1,
+    FAKE_EXPONENT_1,
+    FAKE_IDENTITY_KEY_1,
+    patch_async_setup_entry,
+)
+
+from tests.common import MockConfigEntry
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patched_setup_entry():
+    """Patch entry setup once for the whole module."""
+    with patch_async_setup_entry() as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_setup_entry(_patched_setup_entry):
+    """Hand each test the shared setup mock with a clean call log."""
+    _patched_setup_entry.reset_mock()
+    return _patched_setup_entry
+
+
+async def test_form(hass: HomeAssistant, mock_setup_entry) -> None:
+    """Test we get the form and can create an entry."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {}
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], dict(FAKE_CONFIG_DATA_1)
+    )
+    await hass.async_block_till_done()
+
+    assert result2["type"] == FlowResultType.CREATE_ENTRY
+    assert result2["title"] == f"BlueT {FAKE_IDENTITY_KEY_1[:8]}"
+    assert result2["data"] == FAKE_CONFIG_DATA_1
+    assert len(mock_setup_entry.mock_calls) == 1
+
+
+async def test_invalid_key(hass: HomeAssistant) -> None:
+    """Test an invalid identity key shows an error and we can recover."""
+    result2 = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={
+            CONF_IDENTITY_KEY: "not a valid key",
+            CONF_COUNT: FAKE_COUNT_1,
+            CONF_EXPONENT: FAKE_EXPONENT_1,
+        },
+    )
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["errors"] == {CONF_IDENTITY_KEY: "invalid_key_format"}
+
+    result3 = await hass.config_entries.flow.async_configure(
+        result2["flow_id"], dict(FAKE_CONFIG_DATA_1)
+    )
+    await hass.async_block_till_done()
+
+    assert result3["type"] == FlowResultType.CREATE_ENTRY
+
+
+async def test_duplicate_key(hass: HomeAssistant) -> None:
+    """Test configuring an already configured identity key aborts."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=FAKE_IDENTITY_KEY_1,
+        data=FAKE_CONFIG_DATA_1,
+    )
+    entry.add_to_hass(hass)
+
+    result2 = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data=FAKE_CONFIG_DATA_1,
+    )
+    assert result2["type"] == FlowResultType.ABORT
+    assert result2["reason"] == "already_configured"
@@ -0,0 +1,241 @@
+"""Test the BlueT sensors."""
+from datetime import timedelta
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.bluet.const import (
+    DATA_STALE_SWEEP,
+    DOMAIN,
+    STALE_SWEEP_INTERVAL,
+    UNAVAILABLE_TIMEOUT,
+    UPDATE_INTERVAL,
+)
+from homeassistant.components.bluet.storage import SAVE_DELAY
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from . import (
+    EID_PACKET_1,
+    ETLM_PACKET_1,
+    FAKE_CONFIG_DATA_1,
+    FAKE_COUNT_1,
+    FAKE_EXPONENT_1,
+    FAKE_IDENTITY_KEY_1,
+    FAKE_IDENTITY_KEY_1_BYTES,
+    _generate_eid_packet,
+    _generate_etlm_packet,
+    build_eddystone_service_info,
+)
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.components.bluetooth import inject_bluetooth_service_info
+
+# Advertisement records are read-only once built; share one instance
+# per frame across the module instead of rebuilding it in every test.
+EID_SERVICE_INFO_1 = build_eddystone_service_info(EID_PACKET_1)
+ETLM_SERVICE_INFO_1 = build_eddystone_service_info(ETLM_PACKET_1)
+
+
+async def _setup_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up a config entry for the first fake beacon."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=FAKE_IDENTITY_KEY_1,
+        data=FAKE_CONFIG_DATA_1,
+        title=f"BlueT {FAKE_IDENTITY_KEY_1[:8]}",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.fixture
+async def setup_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the first fake beacon once for tests that share it."""
+    return await _setup_entry(hass)
+
+
+def _sensor_entity_id(hass: HomeAssistant, key: str) -> str:
+    """Resolve the entity id of one of the beacon's sensors."""
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{FAKE_IDENTITY_KEY_1}_{key}"
+    )
+    assert entity_id
+    return entity_id
+
+
+@pytest.mark.parametrize("stored_offset", [None, 5])
+async def test_device_load(
+    hass: HomeAssistant, hass_storage, stored_offset: int | None
+) -> None:
+    """Test a beacon is detected, fresh or restored from storage.
+
+    A new beacon starts at its configured count; one with persisted
+    state resumes from the stored count instead.
+    """
+    expected_count = FAKE_COUNT_1
+    if stored_offset is not None:
+        expected_count = FAKE_COUNT_1 + stored_offset * 2**FAKE_EXPONENT_1
+        hass_storage[DOMAIN] = {
+            "version": 1,
+            "data": {
+                FAKE_IDENTITY_KEY_1: {
+                    "identity_key": FAKE_IDENTITY_KEY_1,
+                    "count": expected_count,
+                    "last_seen": "2023-01-01T00:00:00",
+                }
+            },
+        }
+    entry = await _setup_entry(hass)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert not coordinator.device.present
+    assert coordinator.device.count == expected_count
+
+    inject_bluetooth_service_info(
+        hass,
+        build_eddystone_service_info(
+            _generate_eid_packet(
+                FAKE_IDENTITY_KEY_1_BYTES, expected_count, FAKE_EXPONENT_1
+            )
+        ),
+    )
+
+    assert coordinator.device.present
+    assert coordinator.device.count == expected_count
+
+
+async def test_count_persisted(
+    hass: HomeAssistant, hass_storage, setup_entry: MockConfigEntry
+) -> None:
+    """Test a sighting is persisted on the next refresh, exactly once."""
+    inject_bluetooth_service_info(hass, EID_SERVICE_INFO_1)
+
+    # The refresh only schedules the save; nothing is written until the
+    # store's delay has elapsed as well.
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + UPDATE_INTERVAL + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert DOMAIN not in hass_storage
+
+    async_fire_time_changed(
+        hass, now + UPDATE_INTERVAL + timedelta(seconds=SAVE_DELAY + 2)
+    )
+    await hass.async_block_till_done()
+
+    item = hass_storage[DOMAIN]["data"][FAKE_IDENTITY_KEY_1]
+    assert item["identity_key"] == FAKE_IDENTITY_KEY_1
+    assert item["count"] == FAKE_COUNT_1
+    assert item["last_seen"]
+
+    # A refresh without a new sighting must not schedule another save.
+    hass_storage.pop(DOMAIN)
+    async_fire_time_changed(hass, now + 2 * UPDATE_INTERVAL + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, now + 2 * UPDATE_INTERVAL + timedelta(seconds=SAVE_DELAY + 4)
+    )
+    await hass.async_block_till_done()
+    assert DOMAIN not in hass_storage
+
+
+async def test_eid_rotation(hass: HomeAssistant, setup_entry: MockConfigEntry) -> None:
+    """Test the window keeps following the beacon as its EID rotates."""
+    coordinator = hass.data[DOMAIN][setup_entry.entry_id]
+
+    # Clock drifts forward, far forward, then slightly backward.
+    for offset in (3, 10, 8):
+        count = FAKE_COUNT_1 + offset * 2**FAKE_EXPONENT_1
+        inject_bluetooth_service_info(
+            hass,
+            build_eddystone_service_info(
+                _generate_eid_packet(FAKE_IDENTITY_KEY_1_BYTES, count, FAKE_EXPONENT_1)
+            ),
+        )
+        assert coordinator.device.count == count
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("temperature", "25.5"),
+        ("voltage", "3000"),
+        ("rssi", "-60"),
+    ],
+)
+async def test_sensors(
+    hass: HomeAssistant, setup_entry: MockConfigEntry, key: str, expected: str
+) -> None:
+    """Test the sensors are updated from the beacon's EID and ETLM frames."""
+    entity_id = _sensor_entity_id(hass, key)
+    assert hass.states.get(entity_id).state == "unknown"
+
+    inject_bluetooth_service_info(hass, EID_SERVICE_INFO_1)
+    inject_bluetooth_service_info(hass, ETLM_SERVICE_INFO_1)
+
+    assert hass.states.get(entity_id).state == expected
+
+
+async def test_device_goes_stale(
+    hass: HomeAssistant, setup_entry: MockConfigEntry
+) -> None:
+    """Test the sweep marks a silent beacon not present and notifies."""
+    coordinator = hass.data[DOMAIN][setup_entry.entry_id]
+    entity_id = _sensor_entity_id(hass, "rssi")
+
+    inject_bluetooth_service_info(hass, EID_SERVICE_INFO_1)
+    assert coordinator.device.present
+    assert hass.states.get(entity_id).state == "-60"
+
+    # Age the last sighting past the timeout, then let the sweep run.
+    coordinator.device.last_seen_monotonic -= (
+        UNAVAILABLE_TIMEOUT + STALE_SWEEP_INTERVAL
+    ).total_seconds()
+    async_fire_time_changed(hass, dt_util.utcnow() + STALE_SWEEP_INTERVAL)
+    await hass.async_block_till_done()
+
+    assert not coordinator.device.present
+    assert hass.states.get(entity_id).state == "unknown"
+
+
+async def test_unload_cancels_sweep(
+    hass: HomeAssistant, setup_entry: MockConfigEntry
+) -> None:
+    """Test unloading the last entry cancels the shared stale sweep."""
+    assert DATA_STALE_SWEEP in hass.data[DOMAIN]
+
+    assert await hass.config_entries.async_unload(setup_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert setup_entry.entry_id not in hass.data[DOMAIN]
+    assert DATA_STALE_SWEEP not in hass.data[DOMAIN]
+
+
+async def test_etlm_rejected_for_wrong_count(hass: HomeAssistant) -> None:
+    """Test an ETLM frame for a different counter fails its integrity check."""
+    entry = await _setup_entry(hass)
+
+    # Only the packets need deterministic timestamps; entry setup and
+    # the drain below run with the real clock, keeping freezegun's
+    # patched time functions out of the event-loop machinery.
+    with freeze_time("2023-06-01 12:00:00", tick=False):
+        inject_bluetooth_service_info(hass, EID_SERVICE_INFO_1)
+        inject_bluetooth_service_info(
+            hass,
+            build_eddystone_service_info(
+                _generate_etlm_packet(
+                    FAKE_IDENTITY_KEY_1_BYTES,
+                    FAKE_COUNT_1 + 2**FAKE_EXPONENT_1,
+                    voltage=3000,
+                    temperature=25.5,
+                )
+            ),
+        )
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.device.temperature is None
+    assert coordinator.device.voltage is None